@@ -1,47 +1,60 @@
-import json
+import asyncio
 import os
 import time
-import urllib.request
-import urllib.error
-from typing import Dict, Any, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import aiohttp
+import orjson
+from typing import Dict, Any, List, Tuple
+
+MAX_WORKERS = 50
+
+EVENT_LOOP = asyncio.new_event_loop()
+SESSION = None
+
+REQUEST_HEADERS = {'Content-Type': 'application/json'}
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+OPTIONS_RESPONSE = {
+    'statusCode': 200,
+    'headers': {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'POST, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type',
+        'Access-Control-Max-Age': '86400'
+    },
+    'body': ''
+}
+
+METHOD_NOT_ALLOWED_RESPONSE = {
+    'statusCode': 405,
+    'headers': {'Access-Control-Allow-Origin': '*'},
+    'body': '{"error": "Method not allowed"}'
+}
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     '''
-    Business: Performs stress test by sending 100 POST requests in 50 parallel threads
+    Business: Performs stress test by sending 100 POST requests over 50 pooled connections
     Args: event - dict with httpMethod
           context - object with request_id attribute
     Returns: HTTP response with test results and timing
     '''
     method: str = event.get('httpMethod', 'GET')
-    
+
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
-    
+        return OPTIONS_RESPONSE
+
     if method == 'POST':
         target_url = os.environ.get('STRESS_TEST_URL', 'https://functions.poehali.dev/7dd49f13-ce3c-4f24-a52b-0fbe3a998573')
-        
-        start_time = time.time()
-        results = perform_stress_test(target_url, num_requests=100, max_workers=50)
-        end_time = time.time()
-        
+
+        start_time = time.perf_counter()
+        results, successful, success_duration = perform_stress_test(target_url, num_requests=100, max_workers=MAX_WORKERS)
+        end_time = time.perf_counter()
+
         total_duration = end_time - start_time
-        
-        successful = sum(1 for r in results if r['success'])
+
         failed = len(results) - successful
-        
-        avg_response_time = sum(r['duration'] for r in results if r['success']) / max(successful, 1)
-        
+        avg_response_time = success_duration / max(successful, 1)
+
         return {
             'statusCode': 200,
             'headers': {
@@ -49,7 +62,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'Access-Control-Allow-Origin': '*'
             },
             'isBase64Encoded': False,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'total_duration_seconds': round(total_duration, 3),
                 'total_requests': len(results),
                 'successful_requests': successful,
@@ -58,61 +71,70 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'requests_per_second': round(len(results) / total_duration, 2),
                 'target_url': target_url,
                 'request_id': context.request_id
-            })
+            }).decode('utf-8')
         }
-    
-    return {
-        'statusCode': 405,
-        'headers': {'Access-Control-Allow-Origin': '*'},
-        'body': json.dumps({'error': 'Method not allowed'})
-    }
-
-
-def perform_stress_test(url: str, num_requests: int = 100, max_workers: int = 50) -> List[Dict[str, Any]]:
-    results = []
-    
-    def make_request(request_num: int) -> Dict[str, Any]:
-        start = time.time()
-        try:
-            req = urllib.request.Request(
-                url,
-                method='POST',
-                headers={
-                    'Content-Type': 'application/json'
-                },
-                data=b''
-            )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                status_code = response.status
-                duration = time.time() - start
-                return {
-                    'request_num': request_num,
-                    'success': True,
-                    'status_code': status_code,
-                    'duration': duration
-                }
-        except urllib.error.HTTPError as e:
-            duration = time.time() - start
+
+    return METHOD_NOT_ALLOWED_RESPONSE
+
+
+def perform_stress_test(url: str, num_requests: int = 100, max_workers: int = 50) -> Tuple[List[Dict[str, Any]], int, float]:
+    async def attempt_request(session: aiohttp.ClientSession, start: float) -> Dict[str, Any]:
+        async with session.post(
+            url,
+            data=b'',
+            headers=REQUEST_HEADERS,
+            timeout=REQUEST_TIMEOUT
+        ) as response:
+            status_code = response.status
+            duration = time.perf_counter() - start
+            await response.read()
+        if status_code < 400:
             return {
-                'request_num': request_num,
-                'success': False,
-                'status_code': e.code,
-                'duration': duration,
-                'error': str(e)
+                'success': True,
+                'status_code': status_code,
+                'duration': duration
             }
+        return {
+            'success': False,
+            'status_code': status_code,
+            'duration': duration,
+            'error': f'HTTP Error {status_code}'
+        }
+
+    async def make_request(session: aiohttp.ClientSession) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return await attempt_request(session, start)
         except Exception as e:
-            duration = time.time() - start
             return {
-                'request_num': request_num,
                 'success': False,
                 'status_code': 0,
-                'duration': duration,
+                'duration': time.perf_counter() - start,
                 'error': str(e)
             }
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(make_request, i) for i in range(num_requests)]
-        for future in as_completed(futures):
-            results.append(future.result())
-    
-    return results
\ No newline at end of file
+
+    async def run_all() -> List[Dict[str, Any]]:
+        global SESSION
+        if SESSION is None or SESSION.closed:
+            connector = aiohttp.TCPConnector(limit=max_workers, use_dns_cache=True, ttl_dns_cache=300)
+            SESSION = aiohttp.ClientSession(connector=connector)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def gated_request(session: aiohttp.ClientSession) -> Dict[str, Any]:
+            async with semaphore:
+                return await make_request(session)
+
+        tasks = [gated_request(SESSION) for _ in range(num_requests)]
+        return await asyncio.gather(*tasks)
+
+    results = EVENT_LOOP.run_until_complete(run_all())
+
+    successful = 0
+    success_duration = 0.0
+    for r in results:
+        if r['success']:
+            successful += 1
+            success_duration += r['duration']
+
+    return results, successful, success_duration
